@@ -0,0 +1,69 @@
+"""Column-oriented result batches for Deep Research pipeline stages."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class HarvestBatch:
+    """Discovered sources, one entry per column index."""
+    urls: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    relevance: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def to_dicts(self) -> list[dict]:
+        return [
+            {"url": url, "title": title, "relevance": rel}
+            for url, title, rel in zip(self.urls, self.titles, self.relevance)
+        ]
+
+
+@dataclass
+class FetchBatch:
+    """Fetched source content, one entry per column index."""
+    urls: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    contents: list[str] = field(default_factory=list)
+    fetched_at: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def to_dicts(self) -> list[dict]:
+        return [
+            {"url": url, "title": title, "content": content, "fetched_at": ts}
+            for url, title, content, ts in zip(
+                self.urls, self.titles, self.contents, self.fetched_at
+            )
+        ]
+
+    @classmethod
+    def from_dicts(cls, data: list[dict]) -> "FetchBatch":
+        return cls(
+            urls=[d["url"] for d in data],
+            titles=[d["title"] for d in data],
+            contents=[d.get("content", "") for d in data],
+            fetched_at=[d.get("fetched_at", "") for d in data],
+        )
+
+
+@dataclass
+class ExtractBatch:
+    """Extracted key points and quotes, one entry per column index."""
+    urls: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    key_points: list[list[str]] = field(default_factory=list)
+    quotes: list[list[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def to_dicts(self) -> list[dict]:
+        return [
+            {"url": url, "title": title, "key_points": kp, "quotes": q}
+            for url, title, kp, q in zip(
+                self.urls, self.titles, self.key_points, self.quotes
+            )
+        ]
@@ -1,10 +1,23 @@
 """Cache module for Deep Research."""
 
 import json
+import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from .io_utils import atomic_write_bytes, json_dumps_bytes, json_loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
+_DECODE_ERRORS: tuple = (json.JSONDecodeError,)
+if ijson is not None:
+    _DECODE_ERRORS += (ijson.JSONError,)
+
 
 class CacheManager:
     """
@@ -19,11 +32,46 @@ class CacheManager:
     def __init__(self, cache_dir: str = "./runs/.cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # run_ids whose cache file is known to exist (avoids repeated stat calls)
+        self._known_caches: set[str] = set()
+        # Parsed results kept between runs: run_id -> (mtime_ns, results), LRU order
+        self._mem_cache: OrderedDict[str, tuple[int, list[dict]]] = OrderedDict()
+        self._mem_cache_max = 8
 
     def _get_cache_path(self, run_id: str) -> Path:
         """Get cache file path for a run."""
         return self.cache_dir / f"{run_id}.json"
 
+    def _cache_exists(self, run_id: str) -> bool:
+        """Check cache existence, memoizing positive results."""
+        if run_id in self._known_caches:
+            return True
+        if self._get_cache_path(run_id).exists():
+            self._known_caches.add(run_id)
+            return True
+        return False
+
+    @staticmethod
+    def _stream_results(cache_path: Path, run_id: str) -> Optional[list[dict]]:
+        """Stream-parse cached results without materializing the whole file."""
+        with open(cache_path, "rb") as f:
+            # Verify it's for the same run before parsing the results array
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "run_id":
+                    if value != run_id:
+                        return None
+                    break
+            else:
+                return None
+
+            f.seek(0)
+            return list(ijson.items(f, "results.item", use_float=True))
+
+    def invalidate(self, run_id: str) -> None:
+        """Forget memoized state for a run (e.g. after an external change)."""
+        self._known_caches.discard(run_id)
+        self._mem_cache.pop(run_id, None)
+
     def save_cached(self, run_id: str, data: list[dict]) -> None:
         """
         Save fetched results to cache.
@@ -40,8 +88,9 @@ class CacheManager:
             "results": data,
         }
 
-        with open(cache_path, "w") as f:
-            json.dump(cached_data, f, indent=2)
+        atomic_write_bytes(cache_path, json_dumps_bytes(cached_data, pretty=True))
+        self._mem_cache.pop(run_id, None)
+        self._known_caches.add(run_id)
 
     def load_cached(self, run_id: str) -> Optional[list[dict]]:
         """
@@ -51,51 +100,75 @@ class CacheManager:
             run_id: The run identifier
 
         Returns:
-            Cached results if exists, None otherwise
+            Cached results if exists, None otherwise. Results may be shared
+            with the in-memory cache and must not be mutated.
         """
+        if not self._cache_exists(run_id):
+            return None
+
         cache_path = self._get_cache_path(run_id)
 
-        if not cache_path.exists():
+        try:
+            mtime_ns = cache_path.stat().st_mtime_ns
+
+            # Serve from memory if the file hasn't changed since it was parsed
+            entry = self._mem_cache.get(run_id)
+            if entry is not None and entry[0] == mtime_ns:
+                self._mem_cache.move_to_end(run_id)
+                return entry[1]
+
+            results = self._read_results(cache_path, run_id)
+
+        except (*_DECODE_ERRORS, IOError):
+            self.invalidate(run_id)
             return None
 
-        try:
-            with open(cache_path) as f:
-                cached_data = json.load(f)
+        if results is not None:
+            self._mem_cache[run_id] = (mtime_ns, results)
+            self._mem_cache.move_to_end(run_id)
+            if len(self._mem_cache) > self._mem_cache_max:
+                self._mem_cache.popitem(last=False)
 
-            # Verify it's for the same run
-            if cached_data.get("run_id") == run_id:
-                return cached_data.get("results", [])
+        return results
 
-        except (json.JSONDecodeError, IOError):
-            pass
+    def _read_results(self, cache_path: Path, run_id: str) -> Optional[list[dict]]:
+        """Parse cached results from disk, None if the file is for another run."""
+        if ijson is not None:
+            return self._stream_results(cache_path, run_id)
+
+        cached_data = json_loads(cache_path.read_bytes())
+
+        # Verify it's for the same run
+        if cached_data.get("run_id") == run_id:
+            return cached_data.get("results", [])
 
         return None
 
     def has_cache(self, run_id: str) -> bool:
         """Check if cache exists for a run."""
-        return self._get_cache_path(run_id).exists()
+        return self._cache_exists(run_id)
 
     def delete_cache(self, run_id: str) -> None:
         """Delete cache for a run."""
-        cache_path = self._get_cache_path(run_id)
-        if cache_path.exists():
-            cache_path.unlink()
+        self.invalidate(run_id)
+        self._get_cache_path(run_id).unlink(missing_ok=True)
 
     def clear_all(self) -> None:
         """Clear all cached data."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    os.unlink(entry.path)
+        self._known_caches.clear()
+        self._mem_cache.clear()
 
     def get_cache_info(self, run_id: str) -> Optional[dict]:
         """Get cache metadata."""
-        cache_path = self._get_cache_path(run_id)
-
-        if not cache_path.exists():
+        if not self._cache_exists(run_id):
             return None
 
         try:
-            with open(cache_path) as f:
-                data = json.load(f)
+            data = json_loads(self._get_cache_path(run_id).read_bytes())
 
             return {
                 "run_id": data.get("run_id"),
@@ -104,11 +177,14 @@ class CacheManager:
             }
 
         except (json.JSONDecodeError, IOError):
+            self.invalidate(run_id)
             return None
 
     def list_caches(self) -> list[str]:
         """List all cached run IDs."""
-        caches = []
-        for cache_file in self.cache_dir.glob("*.json"):
-            caches.append(cache_file.stem)
-        return caches
+        with os.scandir(self.cache_dir) as it:
+            return [
+                entry.name[:-5]
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
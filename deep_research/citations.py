@@ -1,11 +1,16 @@
 """Citation manager for Deep Research."""
 
 import hashlib
-import json
-from dataclasses import dataclass, field
+import re
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+from .io_utils import atomic_write_bytes, json_dumps_bytes, json_loads
+
+# Match (C001), (C002), etc.
+_CITE_RE = re.compile(r"\((C\d+)\)")
 
 
 @dataclass
@@ -20,15 +25,8 @@ class Citation:
     local_path: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {
-            "cid": self.cid,
-            "url": self.url,
-            "title": self.title,
-            "locator": self.locator,
-            "fetched_at": self.fetched_at,
-            "quote_hash": self.quote_hash,
-            "local_path": self.local_path,
-        }
+        # Compatibility wrapper; save() serializes the dataclasses directly
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Citation":
@@ -44,15 +42,16 @@ class CitationManager:
     """
 
     def __init__(self):
-        self._citations: list[Citation] = []
         self._cid_counter = 0
         self._citation_map: dict[str, Citation] = {}
+        # Snapshot returned by get_all(), rebuilt after the map changes
+        self._all: Optional[tuple[Citation, ...]] = None
 
     def reset(self) -> None:
         """Reset the citation manager."""
-        self._citations = []
         self._cid_counter = 0
         self._citation_map = {}
+        self._all = None
 
     def add_citation(
         self,
@@ -78,7 +77,7 @@ class CitationManager:
         # Generate quote hash if quote provided
         quote_hash = None
         if quote:
-            quote_hash = hashlib.md5(quote.encode()).hexdigest()[:16]
+            quote_hash = hashlib.blake2b(quote.encode(), digest_size=8).hexdigest()
 
         citation = Citation(
             cid=cid,
@@ -88,8 +87,8 @@ class CitationManager:
             quote_hash=quote_hash,
         )
 
-        self._citations.append(citation)
         self._citation_map[cid] = citation
+        self._all = None
 
         # Update counter
         try:
@@ -105,13 +104,15 @@ class CitationManager:
         """Get citation by ID."""
         return self._citation_map.get(cid)
 
-    def get_all(self) -> list[Citation]:
-        """Get all citations."""
-        return self._citations.copy()
+    def get_all(self) -> Sequence[Citation]:
+        """Get all citations (insertion order) as a read-only tuple."""
+        if self._all is None:
+            self._all = tuple(self._citation_map.values())
+        return self._all
 
     def get_all_dicts(self) -> list[dict]:
         """Get all citations as dictionaries."""
-        return [c.to_dict() for c in self._citations]
+        return [c.to_dict() for c in self._citation_map.values()]
 
     def generate_next_cid(self) -> str:
         """Generate the next citation ID."""
@@ -122,28 +123,28 @@ class CitationManager:
         """Format citation for inline use."""
         return f"({cid})"
 
-    def save(self, path: Path) -> None:
-        """Save citations to JSON file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.get_all_dicts(), f, indent=2)
+    def save(self, path: Path, mkdir: bool = True) -> None:
+        """
+        Save citations to JSON file.
+
+        Pass mkdir=False when the parent directory is known to exist
+        (e.g. a RunState directory).
+        """
+        if mkdir:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(path, json_dumps_bytes(self.get_all(), pretty=True))
 
     def load(self, path: Path) -> None:
         """Load citations from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
-            self.reset()
-            for item in data:
-                citation = Citation.from_dict(item)
-                self._citations.append(citation)
-                self._citation_map[citation.cid] = citation
+        data = json_loads(path.read_bytes())
+        self.reset()
+        for item in data:
+            citation = Citation.from_dict(item)
+            self._citation_map[citation.cid] = citation
 
     def find_citations_in_text(self, text: str) -> list[str]:
         """Find all citation references in text."""
-        import re
-        # Match (C001), (C002), etc.
-        pattern = r"\((C\d+)\)"
-        return re.findall(pattern, text)
+        return _CITE_RE.findall(text)
 
     def validate_citations(self, text: str) -> tuple[int, int]:
         """
@@ -152,6 +153,11 @@ class CitationManager:
         Returns:
             (valid_count, invalid_count)
         """
-        found = self.find_citations_in_text(text)
-        valid = sum(1 for cid in found if cid in self._citation_map)
-        return valid, len(found) - valid
+        cmap = self._citation_map
+        valid = 0
+        total = 0
+        for match in _CITE_RE.finditer(text):
+            total += 1
+            if match.group(1) in cmap:
+                valid += 1
+        return valid, total - valid
@@ -1,8 +1,35 @@
 """Clarification gate for Deep Research."""
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import AbstractSet, Any, Optional
+
+from .io_utils import json_dumps_bytes, json_loads
+
+
+@lru_cache(maxsize=64)
+def _classify(
+    topic: str,
+    min_topic_length: int,
+    ambiguous_terms: frozenset[str],
+    short_topics: frozenset[str],
+) -> tuple[bool, frozenset[str]]:
+    """Pure topic classifier, cached so retries of the same topic are free."""
+    topic_lower = (topic or "").lower()
+    words = frozenset(topic_lower.split())
+
+    if not topic or len(topic.strip()) < min_topic_length:
+        return True, words
+
+    # Contains ambiguous terms
+    if words & ambiguous_terms:
+        return True, words
+
+    # Short known abbreviations
+    if topic_lower in short_topics:
+        return True, words
+
+    return False, words
 
 
 class Clarifier:
@@ -13,21 +40,35 @@ class Clarifier:
     """
 
     # Ambiguity indicators
-    AMBIGUOUS_TERMS = {
+    AMBIGUOUS_TERMS: frozenset[str] = frozenset({
         "it", "this", "that", "they", "them",
         "something", "anything", "what", "how",
-    }
+    })
 
-    SHORT_TOPICS = [
+    SHORT_TOPICS: frozenset[str] = frozenset({
         "ai", "ml", "dl", "llm", "nlp",
         "cv", "ag", "ar", "vr", "mr",
         "web", "app", "db", "os", "api",
-    ]
+    })
 
     def __init__(self):
         self.max_questions = 3
         self.min_topic_length = 20
 
+    def _analyze(self, topic: str) -> tuple[bool, frozenset[str]]:
+        """
+        Tokenize a topic once and classify it.
+
+        Returns:
+            (needs_clarification, lowercased word set)
+        """
+        return _classify(
+            topic,
+            self.min_topic_length,
+            self.AMBIGUOUS_TERMS,
+            self.SHORT_TOPICS,
+        )
+
     def needs_clarification(self, topic: str) -> bool:
         """
         Determine if a topic needs clarification.
@@ -37,27 +78,20 @@ class Clarifier:
         - topic contains ambiguous terms
         - topic is in SHORT_TOPICS list
         """
-        if not topic or len(topic.strip()) < self.min_topic_length:
-            return True
-
-        # Check for ambiguous terms
-        topic_lower = topic.lower()
-        words = topic_lower.split()
-
-        # Contains ambiguous terms
-        if any(term in self.AMBIGUOUS_TERMS for term in words):
-            return True
+        return self._analyze(topic)[0]
 
-        # Short known abbreviations
-        if topic_lower in self.SHORT_TOPICS:
-            return True
-
-        return False
-
-    def generate_questions(self, topic: str) -> list[str]:
+    def generate_questions(
+        self,
+        topic: str,
+        words: Optional[AbstractSet[str]] = None,
+    ) -> list[str]:
         """
         Generate clarification questions for an ambiguous topic.
 
+        Args:
+            topic: The research topic
+            words: Lowercased word set from _analyze (computed if omitted)
+
         Returns up to 3 questions.
         """
         questions = []
@@ -75,7 +109,10 @@ class Clarifier:
                 f"What specifically would you like to learn?"
             )
 
-        if any(term in topic.lower().split() for term in self.AMBIGUOUS_TERMS):
+        if words is None:
+            words = set(topic.lower().split())
+
+        if words & self.AMBIGUOUS_TERMS:
             questions.append(
                 "Your topic seems vague. Could you be more specific about what you mean?"
             )
@@ -107,15 +144,16 @@ class Clarifier:
             - clarified_topic: refined topic (if answered)
             - answers: provided answers
         """
+        needs_clarification, words = self._analyze(topic)
         result = {
-            "needs_clarification": self.needs_clarification(topic),
+            "needs_clarification": needs_clarification,
             "questions": [],
             "clarified_topic": topic,
             "answers": answers or [],
         }
 
-        if result["needs_clarification"]:
-            result["questions"] = self.generate_questions(topic)
+        if needs_clarification:
+            result["questions"] = self.generate_questions(topic, words)
 
         return result
 
@@ -135,10 +173,9 @@ class Clarifier:
             "clarified": bool(answers),
         }
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(json_dumps_bytes(data, pretty=True))
 
     def load_clarify_json(self, input_path: Path) -> dict[str, Any]:
         """Load clarification data from clarify.json."""
-        with open(input_path) as f:
-            return json.load(f)
+        return json_loads(input_path.read_bytes())
@@ -0,0 +1,62 @@
+"""JSON and file I/O helpers for Deep Research."""
+
+import dataclasses
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for objects the stdlib encoder can't handle."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Uses orjson when available, otherwise falls back to the stdlib encoder.
+    Dataclasses are serialized as dicts in both cases.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_DATACLASS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(
+        obj,
+        indent=2 if pretty else None,
+        ensure_ascii=False,
+        default=_default,
+    ).encode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes or text (raises json.JSONDecodeError on bad input)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write data to path atomically.
+
+    Writes to a sibling .tmp file, fsyncs it, then renames it over path, so
+    readers never see a partially written file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
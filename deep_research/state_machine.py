@@ -1,18 +1,29 @@
 """State machine for Deep Research 8-stage pipeline."""
 
-import json
 import os
+import re
 import uuid
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 from .clarify import Clarifier
 from .worker import WorkerPool
-from .citations import CitationManager
+from .citations import Citation, CitationManager
 from .verify import Verifier
 from .cache import CacheManager
+from .batches import HarvestBatch, FetchBatch, ExtractBatch
+from .io_utils import atomic_write_bytes, json_dumps_bytes, json_loads
+
+# Characters dropped from topics when building run IDs.
+# Keeps exactly str.isalnum() characters plus "_" and "-" (Unicode-aware \w).
+_SAFE_ID_RE = re.compile(r"[^\w-]")
+
+
+def safe_topic_id(topic: str) -> str:
+    """Run-ID prefix for a topic: its first 20 characters, sanitized."""
+    return _SAFE_ID_RE.sub("", topic[:20])
 
 
 class Stage(Enum):
@@ -39,6 +50,17 @@ class RunState:
         self.final_dir = self.run_dir / "final"
         self.evidence_dir = self.run_dir / "evidence"
         self.logs_dir = self.run_dir / "logs"
+        self.drafts_dir = self.run_dir / "drafts"
+
+        # Per-run files
+        self.clarify_file = self.run_dir / "clarify.json"
+        self.plan_file = self.logs_dir / "plan.json"
+        self.pipeline_log = self.logs_dir / "pipeline.jsonl"
+        self.paragraphs_file = self.drafts_dir / "paragraphs.jsonl"
+        self.report_file = self.final_dir / "report.md"
+        self.verification_file = self.final_dir / "verification.md"
+        self.verify_file = self.evidence_dir / "verify.json"
+        self.citations_file = self.evidence_dir / "citations.json"
 
         # State
         self.current_stage: Optional[Stage] = None
@@ -47,17 +69,20 @@ class RunState:
         self.budget = 10
         self.lang = "en"
         self.plan: dict = {}
-        self.harvest_results: list = []
-        self.fetch_results: list = []
-        self.extract_results: list = []
-        self.citations: list = []
+        self.harvest_results = HarvestBatch()
+        self.fetch_results = FetchBatch()
+        self.extract_results = ExtractBatch()
+        self.citations: Sequence[Citation] = ()
+        self.report_text: str = ""
         self.clarify_data: dict = {}
+        self._log_buffer: list[bytes] = []
+
+        self._ensure_dirs()
 
-        # Create directories
-        self.run_dir.mkdir(parents=True, exist_ok=True)
-        self.final_dir.mkdir(parents=True, exist_ok=True)
-        self.evidence_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+    def _ensure_dirs(self) -> None:
+        """Create all run directories once (run_dir is created as their parent)."""
+        for directory in (self.final_dir, self.evidence_dir, self.logs_dir, self.drafts_dir):
+            directory.mkdir(parents=True, exist_ok=True)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -109,11 +134,10 @@ class StateMachine:
     def _generate_run_id(self, topic: str) -> str:
         """Generate a unique run ID."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c for c in topic[:20] if c.isalnum() or c in "_-")
-        return f"{safe_topic}_{timestamp}"
+        return f"{safe_topic_id(topic)}_{timestamp}"
 
     def _log_stage(self, state: RunState, stage: Stage, status: str, details: dict = None):
-        """Log stage transition to pipeline.jsonl."""
+        """Buffer a stage transition for pipeline.jsonl (flushed on failure or end of run)."""
         log_entry = {
             "timestamp": datetime.now().isoformat(),
             "run_id": state.run_id,
@@ -121,21 +145,27 @@ class StateMachine:
             "status": status,
             "details": details or {},
         }
-        log_file = state.logs_dir / "pipeline.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        state._log_buffer.append(json_dumps_bytes(log_entry))
+        if status == "failed":
+            self._flush_logs(state)
+
+    def _flush_logs(self, state: RunState):
+        """Append buffered log entries to pipeline.jsonl in a single write."""
+        if not state._log_buffer:
+            return
+        with open(state.pipeline_log, "ab") as f:
+            f.write(b"\n".join(state._log_buffer) + b"\n")
+        state._log_buffer.clear()
 
     def _save_plan(self, state: RunState):
         """Save plan to logs/plan.json."""
-        plan_file = state.logs_dir / "plan.json"
-        with open(plan_file, "w") as f:
-            json.dump({
-                "workers": state.workers,
-                "depth": state.depth,
-                "budget": state.budget,
-                "lang": state.lang,
-                "plan": state.plan,
-            }, f, indent=2)
+        atomic_write_bytes(state.plan_file, json_dumps_bytes({
+            "workers": state.workers,
+            "depth": state.depth,
+            "budget": state.budget,
+            "lang": state.lang,
+            "plan": state.plan,
+        }, pretty=True))
 
     def _run_stage(self, state: RunState, stage: Stage) -> bool:
         """Execute a single stage."""
@@ -177,9 +207,8 @@ class StateMachine:
         """Intake stage: validate and normalize input."""
         # Save clarify.json if exists
         if state.clarify_data:
-            clarify_file = state.run_dir / "clarify.json"
-            with open(clarify_file, "w") as f:
-                json.dump(state.clarify_data, f, indent=2)
+            with open(state.clarify_file, "wb") as f:
+                f.write(json_dumps_bytes(state.clarify_data, pretty=True))
         return True
 
     def _stage_plan(self, state: RunState) -> bool:
@@ -198,10 +227,12 @@ class StateMachine:
         """Harvest stage: discover relevant URLs/sources."""
         # Mock harvest - in production, would call search API
         # Generate exactly budget number of sources
-        state.harvest_results = [
-            {"url": f"https://example.com/{i}", "title": f"Source {i}", "relevance": 0.9 - i*0.1}
-            for i in range(state.budget)
-        ]
+        harvest = HarvestBatch()
+        for i in range(state.budget):
+            harvest.urls.append(f"https://example.com/{i}")
+            harvest.titles.append(f"Source {i}")
+            harvest.relevance.append(0.9 - i*0.1)
+        state.harvest_results = harvest
         return True
 
     def _stage_fetch(self, state: RunState) -> bool:
@@ -209,47 +240,48 @@ class StateMachine:
         # Check cache first
         cached = self.cache_manager.load_cached(state.run_id)
         if cached:
-            state.fetch_results = cached
+            state.fetch_results = FetchBatch.from_dicts(cached)
             return True
 
+        harvest = state.harvest_results
+
         # Mock fetch - in production, would fetch actual content
-        def fetch_one(item: dict) -> dict:
-            return {
-                "url": item["url"],
-                "title": item["title"],
-                "content": f"Mock content for {item['title']}",
-                "fetched_at": datetime.now().isoformat(),
-            }
+        def fetch_one(title: str) -> tuple[str, str]:
+            return f"Mock content for {title}", datetime.now().isoformat()
+
+        fetched = self.worker_pool.run(fetch_one, harvest.titles)
 
-        results = self.worker_pool.run(fetch_one, state.harvest_results)
-        state.fetch_results = results
+        batch = FetchBatch(urls=list(harvest.urls), titles=list(harvest.titles))
+        for content, fetched_at in fetched:
+            batch.contents.append(content)
+            batch.fetched_at.append(fetched_at)
+        state.fetch_results = batch
 
         # Cache results
-        self.cache_manager.save_cached(state.run_id, results)
+        self.cache_manager.save_cached(state.run_id, batch.to_dicts())
         return True
 
     def _stage_extract(self, state: RunState) -> bool:
         """Extract stage: extract key information."""
+        fetched = state.fetch_results
+
         # Mock extraction
-        state.extract_results = [
-            {
-                "url": r["url"],
-                "title": r["title"],
-                "key_points": [f"Key point from {r['title']}"],
-                "quotes": [f"Quote from {r['title']}"],
-            }
-            for r in state.fetch_results
-        ]
+        extract = ExtractBatch(urls=list(fetched.urls), titles=list(fetched.titles))
+        for title in fetched.titles:
+            extract.key_points.append([f"Key point from {title}"])
+            extract.quotes.append([f"Quote from {title}"])
+        state.extract_results = extract
 
         # Build citations
         self.citation_manager.reset()
-        for i, result in enumerate(state.extract_results):
+        urls, titles = extract.urls, extract.titles
+        for i in range(len(extract)):
             cid = f"C{i+1:03d}"
             self.citation_manager.add_citation(
                 cid=cid,
-                url=result["url"],
-                title=result["title"],
-                locator=result.get("url", ""),
+                url=urls[i],
+                title=titles[i],
+                locator=urls[i],
             )
 
         return True
@@ -258,9 +290,8 @@ class StateMachine:
         """Verify stage: verify extracted content before writing."""
         # Generate paragraphs from extract results for verification
         paragraphs = []
-        for i, result in enumerate(state.extract_results):
+        for i, key_points in enumerate(state.extract_results.key_points):
             cid = f"C{i+1:03d}"
-            key_points = result.get("key_points", [])
             if key_points:
                 paragraphs.append({
                     "text": key_points[0],
@@ -268,68 +299,60 @@ class StateMachine:
                 })
 
         # Save paragraphs to drafts/paragraphs.jsonl
-        drafts_dir = state.run_dir / "drafts"
-        drafts_dir.mkdir(parents=True, exist_ok=True)
-        paragraphs_file = drafts_dir / "paragraphs.jsonl"
-
-        with open(paragraphs_file, "w") as f:
-            for para in paragraphs:
-                f.write(json.dumps(para) + "\n")
+        blob = b"\n".join(json_dumps_bytes(para) for para in paragraphs)
+        with open(state.paragraphs_file, "wb") as f:
+            if blob:
+                f.write(blob + b"\n")
 
         # Write evidence/verify.json
-        verify_file = state.evidence_dir / "verify.json"
         verify_data = {
             "stage": "verify",
             "status": "completed",
             "paragraphs_count": len(paragraphs),
             "verified": True,
         }
-        with open(verify_file, "w") as f:
-            json.dump(verify_data, f, indent=2)
+        atomic_write_bytes(state.verify_file, json_dumps_bytes(verify_data, pretty=True))
 
         # Store for later use
         state.paragraphs = paragraphs
 
         return True
 
+    @staticmethod
+    def _format_paragraph(para: dict) -> str:
+        """Render a paragraph with its trailing citation."""
+        cite_ids = para["cite_ids"]
+        if not cite_ids:
+            return para["text"]
+        # Single citation is the common case - skip the join
+        cite_str = cite_ids[0] if len(cite_ids) == 1 else ", ".join(cite_ids)
+        return f"{para['text']} ({cite_str})"
+
     def _stage_write(self, state: RunState) -> bool:
         """Write stage: generate final report using paragraphs from verify stage."""
         # Use paragraphs generated in verify stage
         paragraphs = getattr(state, "paragraphs", [])
 
         # Generate report with citations from paragraphs
-        report_lines = []
-        for para in paragraphs:
-            cite_str = ", ".join(para["cite_ids"]) if para["cite_ids"] else ""
-            if cite_str:
-                report_lines.append(f"{para['text']} ({cite_str})")
-            else:
-                report_lines.append(para["text"])
-
-        report = "# Research Report\n\n" + "\n".join(report_lines)
-        report_file = state.final_dir / "report.md"
-        with open(report_file, "w") as f:
-            f.write(report)
+        body = "\n".join(self._format_paragraph(para) for para in paragraphs)
+        report = f"# Research Report\n\n{body}"
+        state.report_text = report
+        with open(state.report_file, "wb") as f:
+            f.write(report.encode())
 
         # Save citations
-        citations_file = state.evidence_dir / "citations.json"
-        self.citation_manager.save(citations_file)
+        self.citation_manager.save(state.citations_file, mkdir=False)
         state.citations = self.citation_manager.get_all()
 
         return True
 
     def _stage_audit(self, state: RunState) -> bool:
         """Audit stage: final verification."""
-        # Run verification
-        report_file = state.final_dir / "report.md"
-        with open(report_file) as f:
-            report_content = f.read()
-
-        verification_result = self.verifier.verify_report(report_file)
+        # Run verification on the report text kept from the write stage
+        verification_result = self.verifier.verify_text(state.report_text)
 
         # Check paragraphs.jsonl cite_ids
-        paragraphs_file = state.run_dir / "drafts" / "paragraphs.jsonl"
-        paragraphs_jsonl_passed, paragraphs_errors = self.verifier.verify_paragraphs_jsonl(paragraphs_file)
+        paragraphs_jsonl_passed, paragraphs_errors = self.verifier.verify_paragraphs_jsonl(state.paragraphs_file)
 
         # paragraph_end_citation_passed = not paragraphs_without_citation
         paragraph_end_citation_passed = verification_result.paragraph_without_citation_count == 0
@@ -340,8 +363,7 @@ class StateMachine:
         passed = report_passed and paragraphs_jsonl_cite_ids_passed and (verification_result.paragraph_without_citation_count == 0)
 
         # Save verification
-        verification_file = state.final_dir / "verification.md"
-        with open(verification_file, "w") as f:
+        with open(state.verification_file, "w") as f:
             f.write(f"# Verification Report\n\n")
             f.write(f"- paragraph_without_citation_count: {verification_result.paragraph_without_citation_count}\n")
             f.write(f"- total_paragraphs: {verification_result.total_paragraphs}\n")
@@ -352,7 +374,6 @@ class StateMachine:
             f.write(f"- passed: {passed}\n")
 
         # Write verify.json with all required fields (Issue 5)
-        verify_file = state.evidence_dir / "verify.json"
         verify_data = {
             "stage": "audit",
             "status": "completed",
@@ -366,8 +387,7 @@ class StateMachine:
             "citations_found": verification_result.citations_found,
             "passed": passed,  # Issue 1: combined passed from all checks
         }
-        with open(verify_file, "w") as f:
-            json.dump(verify_data, f, indent=2)
+        atomic_write_bytes(state.verify_file, json_dumps_bytes(verify_data, pretty=True))
 
         return passed
 
@@ -408,10 +428,12 @@ class StateMachine:
         state.budget = budget or self.default_budget
         state.lang = lang or self.default_lang
 
-        # Update worker pool size
-        self.worker_pool = WorkerPool(max_workers=state.workers)
+        # Update worker pool size (keep the existing pool if unchanged)
+        if state.workers != self.worker_pool.max_workers:
+            self.worker_pool.update_workers(state.workers)
 
-        # Run clarification if needed
+        # Run clarification if needed. Longer topics reach here already
+        # clarified by the CLI, so their clarify.json must not be replaced.
         if not topic or len(topic) < 20:
             clarification = self.clarifier.clarify(topic)
             if clarification["needs_clarification"]:
@@ -430,9 +452,12 @@ class StateMachine:
             Stage.CACHE,
         ]
 
-        for stage in stages:
-            if not self._run_stage(state, stage):
-                raise RuntimeError(f"Stage {stage.value} failed")
+        try:
+            for stage in stages:
+                if not self._run_stage(state, stage):
+                    raise RuntimeError(f"Stage {stage.value} failed")
+        finally:
+            self._flush_logs(state)
 
         return state
 
@@ -441,19 +466,15 @@ class StateMachine:
         state = RunState(run_id, topic, self.runs_dir)
 
         # Load plan
-        plan_file = state.logs_dir / "plan.json"
-        if plan_file.exists():
-            with open(plan_file) as f:
-                plan_data = json.load(f)
-                state.workers = plan_data.get("workers", 5)
-                state.depth = plan_data.get("depth", "medium")
-                state.budget = plan_data.get("budget", 10)
-                state.lang = plan_data.get("lang", "en")
+        if state.plan_file.exists():
+            plan_data = json_loads(state.plan_file.read_bytes())
+            state.workers = plan_data.get("workers", 5)
+            state.depth = plan_data.get("depth", "medium")
+            state.budget = plan_data.get("budget", 10)
+            state.lang = plan_data.get("lang", "en")
 
         # Load clarify
-        clarify_file = state.run_dir / "clarify.json"
-        if clarify_file.exists():
-            with open(clarify_file) as f:
-                state.clarify_data = json.load(f)
+        if state.clarify_file.exists():
+            state.clarify_data = json_loads(state.clarify_file.read_bytes())
 
         return state
@@ -1,9 +1,12 @@
 """Verification module for Deep Research."""
 
+import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TextIO
+
+from .io_utils import json_loads
 
 
 @dataclass
@@ -18,6 +21,9 @@ class VerificationResult:
     single_source_claims_count: int
     conflicts_count: int
     issues: list[str]
+    # Only filled when verification is run with count_formats=True
+    valid_format_count: int = 0
+    invalid_format_count: int = 0
 
 
 class Verifier:
@@ -29,7 +35,24 @@ class Verifier:
 
     # Citation pattern: (C001), (C002), etc. - must be at END of paragraph (strict \Z)
     # Pattern: matches text ending with (Cddd) or (Cddd, Cddd, ...) - must be at end of paragraph
-    CITATION_PATTERN = re.compile(r".*\(C\d{3}(,\s*C\d{3})*\)\s*\Z")
+    CITATION_PATTERN = re.compile(r".*\(C[0-9]{3}(,\s*C[0-9]{3})*\)\s*\Z")
+
+    # Trailing citation group only, matched from the last "(" of a paragraph.
+    # The group contains no "(" so it can only start there.
+    TAIL_CITATION_RE = re.compile(r"\(C[0-9]{3}(?:,\s*C[0-9]{3})*\)")
+    # Paragraph length from which the tail match beats CITATION_PATTERN
+    _TAIL_MATCH_MIN_LEN = 1024
+
+    # cite_id format in paragraphs.jsonl: C followed by exactly 3 digits
+    CITE_ID_PATTERN = re.compile(r"C[0-9]{3}\Z")
+    # All cite_ids of a file joined with "\n", checked in one fullmatch
+    _CITE_IDS_JOINED_RE = re.compile(r"C[0-9]{3}(?:\nC[0-9]{3})*")
+
+    # Paragraph boundaries: blank lines, or a newline before a non-space
+    _PARA_SPLIT_RE = re.compile(r"\n\s*\n|\n(?=\S)")
+
+    # Any parenthesized group (candidate citation)
+    _PAREN_RE = re.compile(r"\([^)]+\)")
 
     def __init__(self):
         self.strict = True
@@ -40,34 +63,108 @@ class Verifier:
 
         Each paragraph MUST end with a citation (Cxxx...).
         """
-        with open(report_path) as f:
-            content = f.read()
+        with open(report_path, buffering=8192) as f:
+            return self.verify_stream(f)
 
-        return self.verify_text(content)
+    def verify_stream(
+        self, file_obj: TextIO, count_formats: bool = False
+    ) -> VerificationResult:
+        """
+        Verify a text stream paragraph by paragraph.
 
-    def verify_text(self, text: str) -> VerificationResult:
+        Paragraphs are checked as they are read, so the whole report is
+        never held in memory. With count_formats=True the
+        check_citation_format counts are gathered in the same pass.
+        """
+        return self._verify_paragraphs(self._iter_paragraphs(file_obj), count_formats)
+
+    def verify_text(self, text: str, count_formats: bool = False) -> VerificationResult:
         """
         Verify text has proper paragraph-level citations.
 
-        Each paragraph should end with a citation.
+        Each paragraph should end with a citation. With count_formats=True
+        the check_citation_format counts are gathered in the same pass.
+        """
+        # Every citation contains "(C"; without one nothing can pass
+        if "(C" not in text:
+            return self._all_fail_result(text, count_formats)
+        return self._verify_paragraphs(self._split_paragraphs(text), count_formats)
+
+    def _all_fail_result(self, text: str, count_formats: bool = False) -> VerificationResult:
+        """
+        Build the verify_text result for text that contains no "(C".
+
+        Every non-header paragraph is uncited and every (...) group is a
+        malformed citation, so no tail or format matching is needed.
+        """
+        issues = []
+        paragraphs_without_citation = []
+        total_paragraphs = 0
+        invalid_format_count = 0
+        count_parens = count_formats and "(" in text
+
+        for i, para in enumerate(self._split_paragraphs(text)):
+            total_paragraphs += 1
+            if count_parens:
+                invalid_format_count += len(self._PAREN_RE.findall(para))
+            if para[:1] == "#":
+                continue
+            paragraphs_without_citation.append(i)
+            issues.append(f"Paragraph {i+1} missing citation")
+
+        paragraph_without_citation_count = len(paragraphs_without_citation)
+        return VerificationResult(
+            passed=paragraph_without_citation_count == 0,
+            total_paragraphs=total_paragraphs,
+            paragraphs_without_citation=paragraphs_without_citation,
+            paragraph_without_citation_count=paragraph_without_citation_count,
+            citations_found=0,
+            verified_claims_count=0,
+            single_source_claims_count=0,
+            conflicts_count=0,
+            issues=issues,
+            valid_format_count=0,
+            invalid_format_count=invalid_format_count,
+        )
+
+    def _verify_paragraphs(
+        self, paragraphs: Iterable[str], count_formats: bool = False
+    ) -> VerificationResult:
         """
-        # Split into paragraphs
-        paragraphs = self._split_paragraphs(text)
+        Check each paragraph for an ending citation and collect counters.
 
+        Paragraphs must already be stripped and non-empty, as produced by
+        _split_paragraphs and _iter_paragraphs, so no per-paragraph strip
+        copies are needed here.
+        """
         issues = []
         paragraphs_without_citation = []
         citations_found = 0
+        total_paragraphs = 0
+        valid_format_count = 0
+        invalid_format_count = 0
+        citation_match = self.CITATION_PATTERN.match
+        tail_min_len = self._TAIL_MATCH_MIN_LEN
 
         for i, para in enumerate(paragraphs):
-            if not para.strip():
-                continue
+            total_paragraphs += 1
+
+            # Citation format counters, gathered in the same pass on request
+            if count_formats:
+                valid, invalid = self._count_citation_formats(para)
+                valid_format_count += valid
+                invalid_format_count += invalid
 
             # Skip markdown headers (lines starting with # or ##)
-            if para.lstrip().startswith("#"):
+            if para[:1] == "#":
                 continue
 
-            # Check if paragraph ends with citation - use match with \Z for strict end matching
-            has_citation = bool(self.CITATION_PATTERN.match(para.rstrip()))
+            # Check if paragraph ends with citation. Short paragraphs are
+            # matched inline; the method call would cost more than it saves.
+            if len(para) < tail_min_len:
+                has_citation = citation_match(para) is not None
+            else:
+                has_citation = self._ends_with_citation(para)
 
             if has_citation:
                 citations_found += 1
@@ -76,7 +173,6 @@ class Verifier:
                 issues.append(f"Paragraph {i+1} missing citation")
 
         paragraph_without_citation_count = len(paragraphs_without_citation)
-        total_paragraphs = len([p for p in paragraphs if p.strip()])
 
         passed = paragraph_without_citation_count == 0
 
@@ -98,32 +194,99 @@ class Verifier:
             single_source_claims_count=single_source_claims_count,
             conflicts_count=conflicts_count,
             issues=issues,
+            valid_format_count=valid_format_count,
+            invalid_format_count=invalid_format_count,
         )
 
+    def _ends_with_citation(self, stripped: str) -> bool:
+        """
+        Check that a right-stripped paragraph ends with a citation group.
+
+        Equivalent to CITATION_PATTERN.match. Long paragraphs match only the
+        tail instead of scanning with a leading ".*"; as with ".*", no
+        newline may precede the citation group.
+        """
+        # O(1) reject before any scan: uncited paragraphs almost never end in ")"
+        if stripped[-1:] != ")":
+            return False
+        # Below ~1 KB one .* scan is cheaper than rfind + fullmatch + find
+        if len(stripped) < self._TAIL_MATCH_MIN_LEN:
+            return self.CITATION_PATTERN.match(stripped) is not None
+        start = stripped.rfind("(")
+        if start < 0:
+            return False
+        if not self.TAIL_CITATION_RE.fullmatch(stripped, start):
+            return False
+        return stripped.find("\n", 0, start) < 0
+
+    def _iter_paragraphs(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yield stripped, non-empty paragraphs from lines, one at a time.
+
+        Same boundaries as _split_paragraphs: a whitespace-only line, or a
+        line that starts with a non-space character, begins a new paragraph.
+        """
+        current = None
+        for line in lines:
+            if line[-1:] == "\n":
+                line = line[:-1]
+
+            if line[:1].isspace():
+                if not line.isspace():
+                    # Continuation line
+                    current = line if current is None else f"{current}\n{line}"
+                    continue
+                line = ""
+
+            if current is not None:
+                para = current.strip()
+                if para:
+                    yield para
+            current = line or None
+
+        if current is not None:
+            para = current.strip()
+            if para:
+                yield para
+
     def _split_paragraphs(self, text: str) -> list[str]:
         """Split text into paragraphs."""
-        # Split on double newlines or single newlines with space
-        paragraphs = re.split(r"\n\s*\n|\n(?=\S)", text)
-        return [p.strip() for p in paragraphs if p.strip()]
+        # Split on double newlines or single newlines with space. For text
+        # already in memory one C-level re.split beats the per-line scan
+        # that verify_stream needs.
+        return [p for p in map(str.strip, self._PARA_SPLIT_RE.split(text)) if p]
 
     def check_citation_format(self, text: str) -> tuple[int, int]:
         """
         Check citation format in text.
 
+        Uses the same per-paragraph counting as verify_text, which reports
+        these counts on VerificationResult when called with count_formats=True.
+
         Returns:
             (valid_format_count, invalid_format_count)
         """
-        # Find all potential citations
-        potential = re.findall(r"\([^)]+\)", text)
+        valid = 0
+        invalid = 0
+
+        for para in self._split_paragraphs(text):
+            para_valid, para_invalid = self._count_citation_formats(para)
+            valid += para_valid
+            invalid += para_invalid
+
+        return valid, invalid
 
+    def _count_citation_formats(self, para: str) -> tuple[int, int]:
+        """Count well-formed and malformed parenthesized citations in a paragraph."""
         valid = 0
         invalid = 0
 
-        for cit in potential:
+        # Every (...) group is a potential citation
+        for match in self._PAREN_RE.finditer(para):
             # Check if it matches our citation format
-            if self.CITATION_PATTERN.match(cit):
+            if self._ends_with_citation(match.group()):
                 valid += 1
-            elif cit.startswith("(") and cit.endswith(")"):
+            else:
                 # Looks like a citation but wrong format
                 invalid += 1
 
@@ -153,42 +316,68 @@ class Verifier:
         Returns:
             (passed, errors) - passed=True if all lines have valid cite_ids
         """
-        import json
-
         errors = []
         if not paragraphs_path.exists():
             errors.append(f"paragraphs.jsonl not found: {paragraphs_path}")
             return False, errors
 
-        with open(paragraphs_path) as f:
-            lines = f.readlines()
+        # One read, one C-level split; bytes go straight to the JSON decoder
+        lines = paragraphs_path.read_bytes().splitlines()
 
         if not lines:
             errors.append("paragraphs.jsonl is empty")
             return False, errors
 
+        # (line index, message); sorted by line before returning so cite_id
+        # errors found on the slow path interleave as they would in file order
+        line_errors: list[tuple[int, str]] = []
+        to_check: list[tuple[int, list]] = []
         for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
+            if not line or line.isspace():
                 continue
             try:
-                data = json.loads(line)
+                data = json_loads(line)
             except json.JSONDecodeError as e:
-                errors.append(f"Line {i+1}: invalid JSON: {e}")
+                line_errors.append((i, f"Line {i+1}: invalid JSON: {e}"))
                 continue
 
             cite_ids = data.get("cite_ids", [])
             if not cite_ids:
-                errors.append(f"Line {i+1}: cite_ids is empty")
+                line_errors.append((i, f"Line {i+1}: cite_ids is empty"))
                 continue
+            to_check.append((i, cite_ids))
 
+        if not self._cite_ids_all_valid(to_check):
             # Check cite_ids format (Cddd like C001, C002) - strict: C followed by exactly 3 digits
-            cite_id_pattern = re.compile(r"C\d{3}\Z")
-            for cid in cite_ids:
-                if not isinstance(cid, str):
-                    errors.append(f"Line {i+1}: cite_id {cid} is not a string")
-                elif not cite_id_pattern.fullmatch(cid):
-                    errors.append(f"Line {i+1}: cite_id {cid} invalid format (expected C001-C999)")
-
+            for i, cite_ids in to_check:
+                for cid in cite_ids:
+                    if not isinstance(cid, str):
+                        line_errors.append((i, f"Line {i+1}: cite_id {cid} is not a string"))
+                    elif not self.CITE_ID_PATTERN.fullmatch(cid):
+                        line_errors.append(
+                            (i, f"Line {i+1}: cite_id {cid} invalid format (expected C001-C999)")
+                        )
+            line_errors.sort(key=lambda e: e[0])
+
+        errors.extend(msg for _, msg in line_errors)
         passed = len(errors) == 0
         return passed, errors
+
+    def _cite_ids_all_valid(self, to_check: list[tuple[int, list]]) -> bool:
+        """
+        Check every cite_id with a single regex scan over the joined ids.
+
+        A valid id is exactly 4 characters, so the length check rules out
+        ids that smuggle their own newline past the joined match.
+        """
+        ids = [cid for _, cite_ids in to_check for cid in cite_ids]
+        if not ids:
+            return True
+        try:
+            joined = "\n".join(ids)
+        except TypeError:
+            return False
+        return (
+            len(joined) == 5 * len(ids) - 1
+            and self._CITE_IDS_JOINED_RE.fullmatch(joined) is not None
+        )
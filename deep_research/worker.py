@@ -2,7 +2,7 @@
 
 import concurrent.futures
 import threading
-from typing import Any, Callable, Iterable, TypeVar
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -18,6 +18,29 @@ class WorkerPool:
     def __init__(self, max_workers: int = 5):
         self.max_workers = max_workers
         self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def _ensure_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the shared executor, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the shared executor (it is recreated on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def run(self, func: Callable[[T], R], items: list[T]) -> list[R]:
         """
@@ -30,24 +53,8 @@ class WorkerPool:
         Returns:
             List of results in same order as items
         """
-        results = [None] * len(items)
-
-        def process_item(args):
-            index, item = args
-            result = func(item)
-            return index, result
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(process_item, (i, item)): i
-                for i, item in enumerate(items)
-            }
-
-            for future in concurrent.futures.as_completed(futures):
-                index, result = future.result()
-                results[index] = result
-
-        return results
+        executor = self._ensure_executor()
+        return list(executor.map(func, items))
 
     def run_with_index(
         self, func: Callable[[int, T], R], items: list[T]
@@ -62,24 +69,8 @@ class WorkerPool:
         Returns:
             List of results in same order as items
         """
-        results = [None] * len(items)
-
-        def process_item(args):
-            index, item = args
-            result = func(index, item)
-            return index, result
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(process_item, (i, item)): i
-                for i, item in enumerate(items)
-            }
-
-            for future in concurrent.futures.as_completed(futures):
-                index, result = future.result()
-                results[index] = result
-
-        return results
+        executor = self._ensure_executor()
+        return list(executor.map(func, range(len(items)), items))
 
     def map(self, func: Callable[[T], R], iterable: Iterable[T]) -> Iterable[R]:
         """
@@ -87,8 +78,8 @@ class WorkerPool:
 
         Note: Results may not be in order.
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            return list(executor.map(func, iterable))
+        executor = self._ensure_executor()
+        return list(executor.map(func, iterable))
 
     def submit(self, func: Callable[..., R], *args, **kwargs) -> concurrent.futures.Future:
         """
@@ -96,10 +87,17 @@ class WorkerPool:
 
         Returns a Future that can be used to get the result.
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            return executor.submit(func, *args, **kwargs)
+        executor = self._ensure_executor()
+        return executor.submit(func, *args, **kwargs)
 
     def update_workers(self, max_workers: int) -> None:
         """Update the number of workers."""
         with self._lock:
+            if max_workers == self.max_workers:
+                return
             self.max_workers = max_workers
+            executor, self._executor = self._executor, None
+        # Rebuilt with the new size on next use
+        if executor is not None:
+            executor.shutdown(wait=False)
+
@@ -17,35 +17,49 @@ Exit codes:
 
 import sys
 import os
+import shutil
 import subprocess
 import argparse
 from pathlib import Path
 
 # Constants
-DR_PREFIXES = ["/dr", "/deapr"]
+DR_PREFIXES = ("/dr", "/deapr")
 MAX_CLARIFICATION_QUESTIONS = 3
 
+# Fixed paths, resolved once at import
+_HOME = Path.home()
+_LOCAL_BIN = _HOME / ".local/bin"
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+_REPO_DIR = _SCRIPT_DIR.parent
+
+# Resolved dr command path (cached after the first successful lookup)
+_DR_CMD_CACHE = None
+
 
 def find_dr_command():
     """Find dr command in PATH or fallback to repo scripts/dr."""
+    global _DR_CMD_CACHE
+    if _DR_CMD_CACHE is not None:
+        return _DR_CMD_CACHE
+
+    _DR_CMD_CACHE = _lookup_dr_command()
+    return _DR_CMD_CACHE
+
+
+def _lookup_dr_command():
+    """Look up dr command without caching."""
     # Try PATH first
-    result = subprocess.run(
-        ["bash", "-c", "command -v dr"],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
+    dr_path = shutil.which("dr")
+    if dr_path:
+        return dr_path
 
     # Try ~/.local/bin/dr
-    local_bin = Path.home() / ".local/bin/dr"
-    if local_bin.exists():
-        return str(local_bin)
+    local_dr = _LOCAL_BIN / "dr"
+    if local_dr.exists():
+        return str(local_dr)
 
     # Fallback to repo scripts/dr
-    script_dir = Path(__file__).parent.resolve()
-    repo_dir = script_dir.parent
-    repo_dr = repo_dir / "scripts/dr"
+    repo_dr = _REPO_DIR / "scripts/dr"
     if repo_dr.exists():
         return str(repo_dr)
 
@@ -55,19 +69,20 @@ def find_dr_command():
 def parse_topic(text):
     """Parse topic from input text starting with /dr or /deapr."""
     text = text.strip()
-    for prefix in DR_PREFIXES:
-        if text.startswith(prefix):
-            topic = text[len(prefix):].strip()
-            if not topic:
-                print('Topic may need clarification.')
-                print('\nClarifying questions:')
-                print('  1. What specific aspect of this topic are you most interested in?')
-                print('  2. What depth of research do you need? (brief overview / comprehensive analysis)')
-                print('  3. Any specific timeframe or region to focus on?')
-                import sys
-                sys.exit(2)  # bare slash clarify
-            return prefix.strip("/ "), topic
-    return None, text
+    # Single C-level check rejects non-dr input without looping over prefixes
+    if not text.startswith(DR_PREFIXES):
+        return None, text
+
+    prefix = next(p for p in DR_PREFIXES if text.startswith(p))
+    topic = text[len(prefix):].strip()
+    if not topic:
+        print('Topic may need clarification.')
+        print('\nClarifying questions:')
+        print('  1. What specific aspect of this topic are you most interested in?')
+        print('  2. What depth of research do you need? (brief overview / comprehensive analysis)')
+        print('  3. Any specific timeframe or region to focus on?')
+        sys.exit(2)  # bare slash clarify
+    return prefix.strip("/ "), topic
 
 
 def ask_clarification(topic, max_questions=MAX_CLARIFICATION_QUESTIONS):
@@ -91,12 +106,14 @@ def ask_clarification(topic, max_questions=MAX_CLARIFICATION_QUESTIONS):
 
 def execute_dr(topic, dr_path):
     """Execute dr command with the given topic."""
-    # Build environment with PATH including ~/.local/bin
-    env = os.environ.copy()
-    current_path = env.get("PATH", "")
-    local_bin = str(Path.home() / ".local/bin")
-    if local_bin not in current_path:
-        env["PATH"] = f"{local_bin}:{current_path}"
+    # Ensure PATH includes ~/.local/bin; only copy the environment when
+    # PATH actually needs changing, otherwise the child inherits ours
+    current_path = os.environ.get("PATH", "")
+    local_bin = str(_LOCAL_BIN)
+    if local_bin in current_path.split(os.pathsep):
+        env = None
+    else:
+        env = {**os.environ, "PATH": f"{local_bin}{os.pathsep}{current_path}"}
 
     # Execute dr command
     result = subprocess.run(
@@ -2,7 +2,6 @@
 """Deep Research CLI runner - only clarification entry point."""
 
 import argparse
-import json
 import sys
 import os
 from datetime import datetime
@@ -12,6 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from deep_research import StateMachine, Clarifier
+from deep_research.io_utils import json_dumps_bytes, json_loads
+from deep_research.state_machine import safe_topic_id
 
 
 def parse_args():
@@ -40,8 +41,7 @@ def generate_run_id(topic: str = "") -> str:
     """Generate a unique run ID."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if topic:
-        safe_topic = "".join(c for c in topic[:20] if c.isalnum() or c in "_-")
-        return f"{safe_topic}_{timestamp}"
+        return f"{safe_topic_id(topic)}_{timestamp}"
     return f"no_topic_{timestamp}"
 
 
@@ -68,8 +68,7 @@ def handle_no_topic(args) -> None:
     }
 
     clarify_file = run_dir / "clarify.json"
-    with open(clarify_file, "w") as f:
-        json.dump(clarify_data, f, indent=2)
+    clarify_file.write_bytes(json_dumps_bytes(clarify_data, pretty=True))
 
     if args.non_interactive:
         # Non-interactive: print questions and exit(2)
@@ -102,8 +101,7 @@ def handle_no_topic(args) -> None:
     if answers:
         clarify_data["status"] = "clarified"
         clarify_data["answers"] = answers
-        with open(clarify_file, "w") as f:
-            json.dump(clarify_data, f, indent=2)
+        clarify_file.write_bytes(json_dumps_bytes(clarify_data, pretty=True))
 
         # Update topic
         args.topic = " ".join(answers)
@@ -112,8 +110,7 @@ def handle_no_topic(args) -> None:
         # No answers provided - clarification failure
         clarify_data["status"] = "failed"
         clarify_data["failure_reason"] = "No clarification provided"
-        with open(clarify_file, "w") as f:
-            json.dump(clarify_data, f, indent=2)
+        clarify_file.write_bytes(json_dumps_bytes(clarify_data, pretty=True))
         print("\nNo clarification provided. Exiting.")
         sys.exit(1)
 
@@ -153,7 +150,6 @@ def main():
             sys.exit(1)
 
         # Run verification
-        sys.path.insert(0, str(Path(__file__).parent.parent))
         from deep_research.verify import Verifier
 
         verifier = Verifier()
@@ -198,8 +194,7 @@ def main():
         run_id = args.run_id
     else:
         # Generate same ID as state machine would
-        safe_topic = "".join(c for c in args.topic[:20] if c.isalnum() or c in "_-")
-        run_id = f"{safe_topic}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        run_id = f"{safe_topic_id(args.topic)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     runs_dir = Path(args.runs_dir)
     run_dir = runs_dir / run_id
@@ -247,8 +242,7 @@ def main():
 
         run_dir.mkdir(parents=True, exist_ok=True)
         clarify_file = run_dir / "clarify.json"
-        with open(clarify_file, "w") as f:
-            json.dump(clarify_data, f, indent=2)
+        clarify_file.write_bytes(json_dumps_bytes(clarify_data, pretty=True))
 
         if answers:
             args.topic = " ".join(answers)
@@ -283,14 +277,12 @@ def main():
 
         print(f"\nResearch complete!")
         print(f"Run ID: {state.run_id}")
-        print(f"Report: {state.final_dir / 'report.md'}")
-        print(f"Verification: {state.final_dir / 'verification.md'}")
+        print(f"Report: {state.report_file}")
+        print(f"Verification: {state.verification_file}")
 
         # Check verification result - exit(3) if failed
-        verify_file = state.evidence_dir / "verify.json"
-        if verify_file.exists():
-            with open(verify_file) as f:
-                verify_data = json.load(f)
+        if state.verify_file.exists():
+            verify_data = json_loads(state.verify_file.read_bytes())
             if not verify_data.get("passed", False):
                 print(f"\nVerification FAILED. Exiting with code 3.")
                 sys.exit(3)